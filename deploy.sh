@@ -7,6 +7,7 @@ DISCORD_GUILD_IDS=${DISCORD_GUILD_IDS}
 AWS_ACCESS_KEY_ID=${AWS_ACCESS_KEY_ID}
 AWS_SECRET_ACCESS_KEY=${AWS_SECRET_ACCESS_KEY}
 AWS_S3_BUCKET=${AWS_S3_BUCKET}
+AWS_REGION=${AWS_REGION}
 EOF
 
 exec > >(tee /var/log/deploy.log) 2>&1
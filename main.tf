@@ -24,6 +24,7 @@ resource "aws_instance" "app_server" {
     AWS_ACCESS_KEY_ID     = var.aws_access_key_id
     AWS_SECRET_ACCESS_KEY = var.aws_secret_access_key
     AWS_S3_BUCKET         = aws_s3_bucket.app_bucket.id
+    AWS_REGION            = var.region
   })
 
   tags = {
@@ -1,13 +1,15 @@
 """
 Main Discord bot implementation for the meeting bot.
 """
-import os
+import asyncio
+import aiohttp
 import discord
 from discord.ext import commands
 from discord import app_commands
 from dotenv import load_dotenv
 from typing import Optional
 
+from .config import BotConfig
 from .models import Meeting, Update
 from .storage import MeetingStorage
 from .s3_storage import S3Storage
@@ -17,50 +19,46 @@ from .report_generator import ReportGenerator
 class MeetingBot(commands.Bot):
     """Main bot class for handling meeting commands."""
     
-    def __init__(self):
+    def __init__(self, config: BotConfig):
         intents = discord.Intents.default()
         intents.message_content = True
         super().__init__(command_prefix='!', intents=intents)
         
+        self.config = config
         self.storage = MeetingStorage()
-        self.s3_storage = None  # Will be initialized after load_dotenv()
+        self.s3_storage = S3Storage(config)
         self.report_generator = ReportGenerator()
+        self.http_session: Optional[aiohttp.ClientSession] = None  # Created once the event loop is running
         self.guild_id = None
-    
-    def initialize_s3(self):
-        """Initialize S3 storage after environment is loaded."""
-        if self.s3_storage is None:
-            self.s3_storage = S3Storage()
+        
+        self.tree.add_command(meetingbot_command)
     
     async def setup_hook(self):
         """Called when the bot is starting up."""
-        # Initialize S3 storage (dotenv already loaded in main())
-        self.initialize_s3()
-
-        # Resolve guild IDs: prefer DISCORD_GUILD_IDS (comma-separated),
-        # fall back to DISCORD_GUILD_ID, otherwise sync globally
-        env_multi = os.getenv('DISCORD_GUILD_IDS', '')
-        guild_ids = [int(g.strip()) for g in env_multi.split(',') if g.strip()]
-
-        fallback_gid = os.getenv('DISCORD_GUILD_ID')
-        if not guild_ids and fallback_gid:
-            try:
-                guild_ids = [int(fallback_gid)]
-            except ValueError:
-                print("Warning: DISCORD_GUILD_ID is not a valid integer; will sync globally")
+        # Shared HTTP session so connections to S3 are kept alive and reused across meetings
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=60)
+        )
 
+        guild_ids = self.config.guild_ids
         if guild_ids:
             # Per-guild sync for instant availability in each server
             for gid in guild_ids:
                 guild = discord.Object(id=gid)
                 self.tree.copy_global_to(guild=guild)
                 await self.tree.sync(guild=guild)
-            print(f"Synced slash commands for guilds: {guild_ids}")
+            print(f"Synced slash commands for guilds: {list(guild_ids)}")
         else:
             # Global sync (may take up to ~1 hour to propagate)
             await self.tree.sync()
             print("Synced global slash commands")
     
+    async def close(self):
+        """Close the shared HTTP session along with the bot."""
+        if self.http_session is not None:
+            await self.http_session.close()
+        await super().close()
+    
     async def on_ready(self):
         """Called when the bot is ready."""
         print(f'{self.user} has connected to Discord!')
@@ -75,11 +73,11 @@ class MeetingBot(commands.Bot):
         await ctx.send(f"An error occurred: {str(error)}")
 
 
-# Create bot instance
-bot = MeetingBot()
+# Bot instance, created in main() once configuration has been loaded
+bot: Optional[MeetingBot] = None
 
 
-@bot.tree.command(name="meetingbot", description="Meeting bot commands")
+@app_commands.command(name="meetingbot", description="Meeting bot commands")
 @app_commands.describe(action="Action to perform", meeting_id="Meeting ID (for update/close)")
 @app_commands.choices(action=[
     app_commands.Choice(name="new", value="new"),
@@ -117,7 +115,7 @@ async def handle_new_meeting(interaction: discord.Interaction):
 async def handle_update_meeting(interaction: discord.Interaction, meeting_id: str):
     """Handle updating a meeting with a modal form."""
     try:
-        meeting = bot.storage.load_meeting(meeting_id)
+        meeting = await bot.storage.load_meeting_async(meeting_id)
         if not meeting:
             await interaction.response.send_message(f"❌ Meeting `{meeting_id}` not found.", ephemeral=True)
             return
@@ -128,7 +126,7 @@ async def handle_update_meeting(interaction: discord.Interaction, meeting_id: st
 
         # Check if user has already submitted an update for this meeting
         user_str = str(interaction.user)
-        if any(update.user == user_str for update in meeting.updates):
+        if user_str in meeting.contributors:
             await interaction.response.send_message(f"❌ You have already submitted an update for meeting `{meeting_id}`.", ephemeral=True)
             return
         
@@ -143,7 +141,7 @@ async def handle_update_meeting(interaction: discord.Interaction, meeting_id: st
 async def handle_close_meeting(interaction: discord.Interaction, meeting_id: str):
     """Handle closing a meeting."""
     try:
-        meeting = bot.storage.load_meeting(meeting_id)
+        meeting = await bot.storage.load_meeting_async(meeting_id)
         if not meeting:
             await interaction.response.send_message(f"❌ Meeting `{meeting_id}` not found.", ephemeral=True)
             return
@@ -156,19 +154,21 @@ async def handle_close_meeting(interaction: discord.Interaction, meeting_id: str
             await interaction.response.send_message(f"❌ You did not open this meeting.", ephemeral=True)
             return
 
+        # Acknowledge within Discord's 3s window; the save and S3 work can take longer
+        await interaction.response.defer(thinking=True)
+        
         meeting.close()
-        bot.storage.save_meeting(meeting)
+        await bot.storage.save_meeting_async(meeting)
         
+        presigned_url = None
         # Upload to S3 (silent operation)
         if bot.s3_storage and bot.s3_storage.is_available():
             try:
-                # Generate HTML report
-                html_content = bot.report_generator.generate_html_report(meeting)
-                if html_content:
-                    bot.s3_storage.upload_meeting_json(meeting_id, meeting.to_dict())
-                    bot.s3_storage.upload_html_report(meeting_id, html_content)
-                else:
-                    print(f"Warning: Could not generate HTML report for meeting {meeting_id}")
+                # Upload the JSON while the HTML report renders, then upload the report
+                await asyncio.gather(
+                    bot.s3_storage.upload_meeting_json_async(meeting_id, meeting.to_dict()),
+                    render_and_upload_report(meeting)
+                )
                 
                 presigned_url = bot.s3_storage.generate_presigned_url(meeting_id)
             except Exception as e:
@@ -197,11 +197,27 @@ async def handle_close_meeting(interaction: discord.Interaction, meeting_id: str
         
         embed.set_footer(text="Meeting data has been saved and locked.")
         
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
         
     except Exception as e:
         print(f"Error closing meeting: {e}")
-        await interaction.response.send_message("❌ Failed to close meeting. Please try again.", ephemeral=True)
+        if interaction.response.is_done():
+            # The public "thinking" message would take the followup's place; remove
+            # it so the error is sent as a new, private message
+            await interaction.delete_original_response()
+            await interaction.followup.send("❌ Failed to close meeting. Please try again.", ephemeral=True)
+        else:
+            await interaction.response.send_message("❌ Failed to close meeting. Please try again.", ephemeral=True)
+
+
+async def render_and_upload_report(meeting: Meeting) -> bool:
+    """Render a meeting's HTML report in a worker thread and upload it to S3."""
+    html_content = await asyncio.to_thread(bot.report_generator.generate_html_report, meeting)
+    if not html_content:
+        print(f"Warning: Could not generate HTML report for meeting {meeting.id}")
+        return False
+    
+    return await bot.s3_storage.upload_html_report_presigned(bot.http_session, meeting.id, html_content)
 
 
 class UpdateModal(discord.ui.Modal, title="Meeting Update"):
@@ -238,15 +254,23 @@ class UpdateModal(discord.ui.Modal, title="Meeting Update"):
     async def on_submit(self, interaction: discord.Interaction):
         """Handle form submission."""
         try:
-            meeting = bot.storage.load_meeting(self.meeting_id)
-            meeting.add_update(
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            
+            meeting = await bot.storage.load_meeting_async(self.meeting_id)
+            update = meeting.add_update(
                 user=str(interaction.user),
                 progress=self.progress.value.strip(),
                 blockers=self.blockers.value.strip(),
                 goals=self.goals.value.strip()
             )
             
-            bot.storage.save_meeting(meeting)
+            await bot.storage.add_update_async(meeting.id, update)
+            # Render this update's report fragment now so closing only has to join them.
+            # It is only a cache (rebuilt at close if missing), so don't fail the saved update over it.
+            try:
+                await bot.report_generator.cache_update_fragment_async(meeting, update)
+            except Exception as e:
+                print(f"Warning: Could not render report fragment for meeting {meeting.id}: {e}")
             
             embed = discord.Embed(
                 title="✅ Update Added",
@@ -259,13 +283,13 @@ class UpdateModal(discord.ui.Modal, title="Meeting Update"):
             embed.add_field(name="Total Updates", value=str(len(meeting.updates)), inline=True)
             embed.add_field(name="Updated by", value=interaction.user.mention, inline=True)
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
             
         except ValueError as e:
-            await interaction.response.send_message(f"❌ Validation error: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Validation error: {str(e)}", ephemeral=True)
         except Exception as e:
             print(f"Error submitting update: {e}")
-            await interaction.response.send_message("❌ Failed to submit update. Please try again.", ephemeral=True)
+            await interaction.followup.send("❌ Failed to submit update. Please try again.", ephemeral=True)
 
 class CreateMeetingModal(discord.ui.Modal, title="Create Meeting"):
     """Modal form for creating a new meeting."""
@@ -295,7 +319,7 @@ class CreateMeetingModal(discord.ui.Modal, title="Create Meeting"):
             name = self.name.value.strip() if self.name.value else ""
             link = self.link.value.strip() if self.link.value else ""
             meeting = Meeting.create_new(created_by=str(interaction.user), name=name, link=link)
-            bot.storage.save_meeting(meeting)
+            await bot.storage.save_meeting_async(meeting)
             
             embed = discord.Embed(
                 title="✅ New Meeting Created",
@@ -315,16 +339,20 @@ class CreateMeetingModal(discord.ui.Modal, title="Create Meeting"):
 
 def main():
     """Main function to run the bot."""
+    global bot
+    
     load_dotenv()
+    config = BotConfig.from_env()
     
-    token = os.getenv('DISCORD_TOKEN')
-    if not token:
+    if not config.discord_token:
         print("❌ DISCORD_TOKEN not found in environment variables!")
         print("Please create a .env file with your Discord bot token.")
         return
     
+    bot = MeetingBot(config)
+    
     try:
-        bot.run(token)
+        bot.run(config.discord_token)
     except discord.LoginFailure:
         print("❌ Invalid Discord bot token!")
     except Exception as e:
@@ -0,0 +1,61 @@
+"""
+Process configuration for the meeting bot, read once from the environment.
+"""
+import os
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import boto3
+
+
+DEFAULT_AWS_REGION = 'us-east-1'
+
+
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """Immutable snapshot of the bot's environment configuration."""
+    discord_token: Optional[str] = field(repr=False)
+    guild_ids: Tuple[int, ...]
+    aws_bucket: Optional[str]
+    aws_access_key: Optional[str]
+    aws_secret_key: Optional[str] = field(repr=False)
+    aws_region: str = DEFAULT_AWS_REGION
+
+    @classmethod
+    def from_env(cls) -> 'BotConfig':
+        """Build the configuration from environment variables (call after load_dotenv())."""
+        # Prefer DISCORD_GUILD_IDS (comma-separated), fall back to DISCORD_GUILD_ID,
+        # otherwise commands are synced globally
+        env_multi = os.getenv('DISCORD_GUILD_IDS', '')
+        guild_ids = tuple(int(g.strip()) for g in env_multi.split(',') if g.strip())
+
+        fallback_gid = os.getenv('DISCORD_GUILD_ID')
+        if not guild_ids and fallback_gid:
+            try:
+                guild_ids = (int(fallback_gid),)
+            except ValueError:
+                print("Warning: DISCORD_GUILD_ID is not a valid integer; will sync globally")
+
+        return cls(
+            discord_token=os.getenv('DISCORD_TOKEN'),
+            guild_ids=guild_ids,
+            aws_bucket=os.getenv('AWS_S3_BUCKET'),
+            aws_access_key=os.getenv('AWS_ACCESS_KEY_ID'),
+            aws_secret_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+            aws_region=_resolve_aws_region()
+        )
+
+
+def _resolve_aws_region() -> str:
+    """
+    Resolve the AWS region the way boto3 would, then fall back to the default.
+
+    AWS_REGION wins, then AWS_DEFAULT_REGION and the shared AWS config
+    (~/.aws/config, AWS_PROFILE), which boto3's default session reads.
+    """
+    return (
+        os.getenv('AWS_REGION')
+        or os.getenv('AWS_DEFAULT_REGION')
+        or boto3.session.Session().region_name
+        or DEFAULT_AWS_REGION
+    )
@@ -3,11 +3,11 @@ Data models for the meeting bot.
 """
 import uuid
 from datetime import datetime
-from typing import List, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Optional, Set
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Update:
     """Represents a single update in a meeting."""
     user: str
@@ -18,24 +18,46 @@ class Update:
     
     def __post_init__(self):
         """Validate update data after initialization."""
-        self._validate()
+        self.validate(self.progress, self.blockers, self.goals)
+    
+    @classmethod
+    def from_stored(cls, user: str, progress: str, blockers: str, goals: str, timestamp: str) -> 'Update':
+        """Rebuild an update from storage, skipping validation (it was validated when first saved)."""
+        update = object.__new__(cls)
+        update.user = user
+        update.progress = progress
+        update.blockers = blockers
+        update.goals = goals
+        update.timestamp = timestamp
+        return update
     
-    def _validate(self):
+    def to_dict(self):
+        """Convert update to dictionary for JSON serialization."""
+        return {
+            'user': self.user,
+            'progress': self.progress,
+            'blockers': self.blockers,
+            'goals': self.goals,
+            'timestamp': self.timestamp
+        }
+    
+    @classmethod
+    def validate(cls, progress: str, blockers: str, goals: str):
         """Validate update fields."""
         max_length = 500
         
-        if not self.progress.strip():
+        if not progress.strip():
             raise ValueError("Progress field is required")
-        if not self.blockers.strip():
+        if not blockers.strip():
             raise ValueError("Blockers field is required")
-        if not self.goals.strip():
+        if not goals.strip():
             raise ValueError("Goals field is required")
         
-        if len(self.progress) > max_length:
+        if len(progress) > max_length:
             raise ValueError(f"Progress field must be {max_length} characters or less")
-        if len(self.blockers) > max_length:
+        if len(blockers) > max_length:
             raise ValueError(f"Blockers field must be {max_length} characters or less")
-        if len(self.goals) > max_length:
+        if len(goals) > max_length:
             raise ValueError(f"Goals field must be {max_length} characters or less")
 
 
@@ -50,6 +72,15 @@ class Meeting:
     link: str
     is_closed: bool = False
     closed_at: Optional[str] = None
+    # Users who have submitted an update; derived from updates, not persisted
+    contributors: Set[str] = field(init=False, repr=False, compare=False)
+    # Rendered HTML report fragments for updates[:len(report_fragments)]; not persisted
+    report_fragments: List[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Index contributors and start with no rendered report fragments."""
+        self.contributors = {update.user for update in self.updates}
+        self.report_fragments = []
 
     def add_update(self, user: str, progress: str, blockers: str, goals: str) -> Update:
         """Add a new update to the meeting."""
@@ -65,6 +96,7 @@ class Meeting:
         )
         
         self.updates.append(update)
+        self.contributors.add(user)
         return update
     
     def close(self):
@@ -81,7 +113,7 @@ class Meeting:
             'id': self.id,
             'created_by': self.created_by,
             'created_at': self.created_at,
-            'updates': [asdict(update) for update in self.updates],
+            'updates': [update.to_dict() for update in self.updates],
             'is_closed': self.is_closed,
             'closed_at': self.closed_at,
             'name': self.name,
@@ -90,8 +122,8 @@ class Meeting:
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Meeting':
-        """Create meeting from dictionary."""
-        updates = [Update(**update_data) for update_data in data.get('updates', [])]
+        """Create meeting from dictionary. Updates are trusted and not re-validated."""
+        updates = [Update.from_stored(**update_data) for update_data in data.get('updates', [])]
         
         return cls(
             id=data['id'],
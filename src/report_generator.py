@@ -2,10 +2,16 @@
 HTML report generation for meetings using Jinja2 templates.
 """
 import os
+import asyncio
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
-from typing import Optional
-from .models import Meeting
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from typing import Dict, Optional
+from .models import Meeting, Update
+
+
+# The report is a header, one fragment per update, then a footer. Updates are
+# append-only, so each fragment is rendered once and reused at close time.
+REPORT_TEMPLATES = ('header.html', 'update_fragment.html', 'footer.html')
 
 
 class ReportGenerator:
@@ -19,13 +25,52 @@ class ReportGenerator:
         # Set up Jinja2 environment
         self.jinja_env = Environment(
             loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=True
+            autoescape=True,
+            auto_reload=False
         )
+        
+        # Compile the report templates once; missing ones are resolved lazily on first render
+        self._templates: Dict[str, Template] = {}
+        for name in REPORT_TEMPLATES:
+            try:
+                self._templates[name] = self.jinja_env.get_template(name)
+            except TemplateNotFound:
+                print(f"Warning: {name} not found in {self.template_dir}; will retry on first render")
+    
+    def _get_template(self, name: str) -> Template:
+        """Get a compiled report template, loading it if it was missing at startup."""
+        template = self._templates.get(name)
+        if template is None:
+            template = self._templates[name] = self.jinja_env.get_template(name)
+        return template
+    
+    def render_update_fragment(self, update: Update) -> str:
+        """Render the HTML fragment for a single update."""
+        return self._get_template('update_fragment.html').render(update=update)
+    
+    async def cache_update_fragment_async(self, meeting: Meeting, update: Update) -> None:
+        """
+        Render an update's fragment in a worker thread and cache it on the meeting.
+        
+        Must be called on the event loop, which is the only place report_fragments
+        is modified. The fragment is only cached if every earlier update already
+        has one; anything skipped is rendered when the report is generated.
+        """
+        index = len(meeting.updates) - 1
+        while index >= 0 and meeting.updates[index] is not update:
+            index -= 1
+        
+        fragment = await asyncio.to_thread(self.render_update_fragment, update)
+        if len(meeting.report_fragments) == index:
+            meeting.report_fragments.append(fragment)
     
     def generate_html_report(self, meeting: Meeting) -> Optional[str]:
         """
         Generate HTML report for a meeting.
         
+        Update fragments already rendered on the meeting are reused, so only the
+        header, footer and any new updates are rendered here.
+        
         Args:
             meeting: The Meeting object to generate report for
             
@@ -33,8 +78,14 @@ class ReportGenerator:
             str: HTML content as string, or None if generation failed
         """
         try:
-            template = self.jinja_env.get_template('meeting_report.html')
-            html_content = template.render(meeting=meeting)
+            # Work from a copy; this may run in a worker thread and must not modify the meeting
+            fragments = list(meeting.report_fragments)
+            fragments.extend(self.render_update_fragment(update) for update in meeting.updates[len(fragments):])
+            html_content = '\n'.join([
+                self._get_template('header.html').render(meeting=meeting),
+                *fragments,
+                self._get_template('footer.html').render(meeting=meeting)
+            ])
             
             print(f"Successfully generated HTML report for meeting {meeting.id}")
             return html_content
@@ -81,7 +132,6 @@ class ReportGenerator:
         return self.template_dir
     
     def template_exists(self) -> bool:
-        """Check if the meeting report template exists."""
-        template_file = self.template_dir / "meeting_report.html"
-        return template_file.exists()
+        """Check if the meeting report templates exist."""
+        return all((self.template_dir / name).exists() for name in REPORT_TEMPLATES)
 
@@ -1,33 +1,43 @@
 """
-Local preview script to render meeting_report.html from a local meeting JSON.
+Local preview script to render the meeting report templates from local meeting data.
 Usage:
-  python -m src.report_preview --input json/<meeting_id>/meeting.json --output preview.html
+  python -m src.report_preview --meeting-id <meeting_id> --output preview.html
+  python -m src.report_preview --input path/to/meeting.json --output preview.html
 """
 import argparse
-import json
 from pathlib import Path
 
+import orjson
+
 from .models import Meeting
 from .report_generator import ReportGenerator
+from .storage import MeetingStorage
 
 
 def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Render meeting HTML from local JSON for preview")
-    parser.add_argument("--input", required=True, help="Path to meeting.json")
+    parser = argparse.ArgumentParser(description="Render meeting HTML from local meeting data for preview")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--meeting-id", help="ID of a meeting in the local meeting database")
+    source.add_argument("--input", help="Path to a meeting.json (e.g. one downloaded from S3)")
     parser.add_argument("--output", default="preview.html", help="Output HTML file path")
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    input_path = Path(args.input)
-    if not input_path.exists():
-        raise SystemExit(f"Input file not found: {input_path}")
-
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    meeting = Meeting.from_dict(data)
+    if args.meeting_id:
+        meeting = MeetingStorage().load_meeting(args.meeting_id)
+        if meeting is None:
+            raise SystemExit(f"Meeting not found: {args.meeting_id}")
+    else:
+        input_path = Path(args.input)
+        if not input_path.exists():
+            raise SystemExit(f"Input file not found: {input_path}")
+
+        with open(input_path, "rb") as f:
+            data = orjson.loads(f.read())
+
+        meeting = Meeting.from_dict(data)
 
     generator = ReportGenerator()
     html = generator.generate_html_report(meeting)
@@ -1,21 +1,66 @@
 """
 S3 storage system for archiving closed meetings.
 """
-import os
-import json
+import asyncio
+import hmac
+import hashlib
+import functools
+import time
+from datetime import datetime, timezone
+from urllib.parse import quote, urlparse
+import aiohttp
 import boto3
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+from .config import BotConfig
+
+
+# Attempts for presigned uploads, which don't go through boto3's retry handling
+UPLOAD_MAX_ATTEMPTS = 3
+# Per-attempt limit, so every retry finishes well inside Discord's 15-minute followup window
+UPLOAD_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_s3_client(access_key: str, secret_key: str, region: str):
+    """
+    Build (or reuse) a boto3 S3 client for the given credentials and region.
+
+    Client construction (including endpoint resolution for the region's
+    partition) is expensive, so clients are shared across S3Storage instances.
+    The connection pool is sized for concurrent close events.
+    """
+    session = boto3.session.Session(
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region
+    )
+    return session.client(
+        's3',
+        config=Config(
+            signature_version='s3v4',
+            s3={'addressing_style': 'virtual'},
+            max_pool_connections=50,
+            retries={'max_attempts': 3, 'mode': 'adaptive'},
+            tcp_keepalive=True
+        )
+    )
 
 
 class S3Storage:
     """Handles S3 operations for meeting data and reports."""
     
-    def __init__(self):
-        """Initialize S3 client with credentials from environment."""
-        self.bucket_name = os.getenv('AWS_S3_BUCKET')
-        self.access_key = os.getenv('AWS_ACCESS_KEY_ID')
-        self.secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
+    def __init__(self, config: BotConfig):
+        """Initialize S3 client with credentials from the bot configuration."""
+        self.bucket_name = config.aws_bucket
+        self.access_key = config.aws_access_key
+        self.secret_key = config.aws_secret_key
+        self.region = config.aws_region
+        self._signing_key_cache = (None, None)  # (UTC date stamp, derived SigV4 signing key)
+        self._url_cache: Dict[Tuple[str, int], Tuple[float, str]] = {}  # (meeting ID, expires) -> (expiry time, URL)
         
         if not all([self.bucket_name, self.access_key, self.secret_key]):
             print("Warning: AWS credentials not found. S3 uploads will be disabled.")
@@ -23,11 +68,10 @@ class S3Storage:
             return
         
         try:
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=self.access_key,
-                aws_secret_access_key=self.secret_key
-            )
+            self.s3_client = _get_s3_client(self.access_key, self.secret_key, self.region)
+            # Virtual-host style host for the local signer, from the endpoint botocore resolved
+            # for the region (e.g. s3.amazonaws.com, s3.eu-west-2.amazonaws.com, *.amazonaws.com.cn)
+            self._host = f"{self.bucket_name}.{urlparse(self.s3_client.meta.endpoint_url).netloc}"
             print(f"S3 client initialized for bucket: {self.bucket_name}")
         except NoCredentialsError:
             print("Error: AWS credentials are invalid. S3 uploads will be disabled.")
@@ -56,15 +100,15 @@ class S3Storage:
             return False
         
         try:
-            # Convert meeting data to JSON string
-            json_content = json.dumps(meeting_data, indent=2, ensure_ascii=False)
+            # Serialize meeting data straight to UTF-8 JSON bytes
+            json_content = orjson.dumps(meeting_data, option=orjson.OPT_INDENT_2)
             
             # Upload to S3
             key = f"meetings/{meeting_id}/meeting.json"
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=key,
-                Body=json_content.encode('utf-8'),
+                Body=json_content,
                 ContentType='application/json'
             )
             
@@ -78,11 +122,22 @@ class S3Storage:
             print(f"Unexpected error uploading meeting JSON for {meeting_id}: {e}")
             return False
     
-    def upload_html_report(self, meeting_id: str, html_content: str) -> bool:
+    async def upload_meeting_json_async(self, meeting_id: str, meeting_data: dict) -> bool:
+        """Upload meeting JSON data to S3 from a worker thread without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.upload_meeting_json, meeting_id, meeting_data))
+    
+    async def upload_html_report_presigned(self, session: aiohttp.ClientSession, meeting_id: str, html_content: str) -> bool:
         """
-        Upload HTML report to S3.
+        Upload HTML report to S3 through a presigned PUT URL.
+        
+        The body is sent with the shared aiohttp session, so the upload does not
+        occupy a worker thread and connections to S3 are pooled across meetings.
+        This bypasses the boto3 client's retry policy, so throttling, 5xx
+        responses and connection errors are retried here with backoff.
         
         Args:
+            session: The aiohttp session to send the request with
             meeting_id: The meeting ID
             html_content: The HTML content string
             
@@ -93,37 +148,178 @@ class S3Storage:
             print(f"S3 not available, skipping HTML upload for meeting {meeting_id}")
             return False
         
-        try:
-            # Upload HTML to S3
-            key = f"meetings/{meeting_id}/index.html"
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=html_content.encode('utf-8'),
-                ContentType='text/html'
-            )
+        key = f"meetings/{meeting_id}/index.html"
+        body = html_content.encode('utf-8')
+        
+        for attempt in range(1, UPLOAD_MAX_ATTEMPTS + 1):
+            try:
+                url = self.generate_presigned_put(key, 'text/html')
+                async with session.put(url, data=body, headers={'Content-Type': 'text/html'}, timeout=UPLOAD_TIMEOUT) as response:
+                    if response.status == 200:
+                        print(f"Successfully uploaded HTML report for {meeting_id} to S3")
+                        return True
+                    
+                    error = f"HTTP {response.status}: {await response.text()}"
+                    retryable = response.status == 429 or response.status >= 500
+                    
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
+                retryable = True
+            except Exception as e:
+                print(f"Unexpected error uploading HTML report for {meeting_id}: {e}")
+                return False
             
-            print(f"Successfully uploaded HTML report for {meeting_id} to S3")
-            return True
+            if not retryable or attempt == UPLOAD_MAX_ATTEMPTS:
+                print(f"Error uploading HTML report for {meeting_id}: {error}")
+                return False
             
-        except ClientError as e:
-            print(f"Error uploading HTML report for {meeting_id}: {e}")
-            return False
-        except Exception as e:
-            print(f"Unexpected error uploading HTML report for {meeting_id}: {e}")
-            return False
+            print(f"Retrying HTML upload for {meeting_id} after error: {error}")
+            await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+        
+        return False
+    
+    def generate_presigned_put(self, key: str, content_type: str, expires: int = 3600) -> str:
+        """
+        Generate a presigned URL for uploading an object.
+        
+        Only the host header is signed by the local signer, so the caller should
+        send content_type as the Content-Type header and S3 will store it as is.
+        
+        Args:
+            key: The object key
+            content_type: The Content-Type the object will be uploaded with
+            expires: Number of seconds the URL stays valid
+            
+        Returns:
+            str: The presigned URL
+        """
+        if '.' in self.bucket_name:
+            return self.s3_client.generate_presigned_url('put_object', Params={'Bucket': self.bucket_name, 'Key': key, 'ContentType': content_type}, ExpiresIn=expires)
+        
+        return self._sign_url('PUT', key, expires, datetime.now(timezone.utc))
     
-    def generate_presigned_url(self, meeting_id: str) -> str:
+    def generate_presigned_url(self, meeting_id: str, expires: int = 3600) -> str:
         """
         Generate a presigned URL for the HTML report.
         
+        The URL is signed locally with SigV4 rather than through boto3's
+        presign pipeline. Buckets whose names contain dots cannot be addressed
+        virtual-host style over HTTPS, so those fall back to boto3. URLs are
+        cached and reused while they have more than a minute of validity left.
+        
         Args:
             meeting_id: The meeting ID
+            expires: Number of seconds the URL stays valid
             
         Returns:
             str: The presigned URL
         """
-        return self.s3_client.generate_presigned_url('get_object', Params={'Bucket': self.bucket_name, 'Key': f'meetings/{meeting_id}/index.html'}, ExpiresIn=3600)
+        now = time.time()
+        cached = self._url_cache.get((meeting_id, expires))
+        if cached is not None and cached[0] - now > 60:
+            return cached[1]
+        
+        key = f"meetings/{meeting_id}/index.html"
+        if '.' in self.bucket_name:
+            url = self.s3_client.generate_presigned_url('get_object', Params={'Bucket': self.bucket_name, 'Key': key}, ExpiresIn=expires)
+        else:
+            url = self._sign_url('GET', key, expires, datetime.fromtimestamp(now, timezone.utc))
+        
+        # Drop expired entries so the cache only holds URLs that are still usable
+        self._url_cache = {k: v for k, v in self._url_cache.items() if v[0] > now}
+        self._url_cache[(meeting_id, expires)] = (now + expires, url)
+        return url
+    
+    def generate_presigned_urls(self, keys: List[str], expires: int = 3600) -> Dict[str, str]:
+        """
+        Generate presigned GET URLs for several objects at once.
+        
+        All URLs share one signing time, so the date, credential scope, query
+        string and signing key are computed once for the whole batch; each key
+        only costs its canonical-request hash and the final HMAC.
+        
+        Args:
+            keys: The object keys
+            expires: Number of seconds the URLs stay valid
+            
+        Returns:
+            dict: Mapping of object key to presigned URL
+        """
+        if '.' in self.bucket_name:
+            return {
+                key: self.s3_client.generate_presigned_url('get_object', Params={'Bucket': self.bucket_name, 'Key': key}, ExpiresIn=expires)
+                for key in keys
+            }
+        
+        params = self._signing_params('GET', expires, datetime.now(timezone.utc))
+        return {key: self._sign_key(key, *params) for key in keys}
+    
+    def _get_signing_key(self, date_stamp: str) -> bytes:
+        """Derive the SigV4 signing key for a UTC date (YYYYMMDD), caching it for the day."""
+        cached_date, signing_key = self._signing_key_cache
+        if cached_date == date_stamp:
+            return signing_key
+        
+        k_date = hmac.new(f"AWS4{self.secret_key}".encode('utf-8'), date_stamp.encode('utf-8'), hashlib.sha256).digest()
+        k_region = hmac.new(k_date, self.region.encode('utf-8'), hashlib.sha256).digest()
+        k_service = hmac.new(k_region, b's3', hashlib.sha256).digest()
+        signing_key = hmac.new(k_service, b'aws4_request', hashlib.sha256).digest()
+        self._signing_key_cache = (date_stamp, signing_key)
+        return signing_key
+    
+    def _sign_url(self, method: str, key: str, expires: int, now: datetime) -> str:
+        """
+        Build a SigV4 query-string-signed URL for an object in the bucket.
+        
+        Args:
+            method: The HTTP method the URL will be used with
+            key: The object key
+            expires: Number of seconds the URL stays valid
+            now: The signing time (UTC)
+            
+        Returns:
+            str: The presigned URL
+        """
+        return self._sign_key(key, *self._signing_params(method, expires, now))
+    
+    def _signing_params(self, method: str, expires: int, now: datetime) -> Tuple[str, str, str, str, bytes]:
+        """
+        Precompute the key-independent parts of a SigV4 presigned URL.
+        
+        Args:
+            method: The HTTP method the URLs will be used with
+            expires: Number of seconds the URLs stay valid
+            now: The signing time (UTC)
+            
+        Returns:
+            tuple: (method, query, canonical request suffix, string-to-sign prefix, signing key),
+            to be passed to _sign_key
+        """
+        date_stamp = now.strftime('%Y%m%d')
+        amz_date = now.strftime('%Y%m%dT%H%M%SZ')
+        scope = f"{date_stamp}/{self.region}/s3/aws4_request"
+        
+        # Parameters must be in sorted order for the canonical query string
+        query = (
+            f"X-Amz-Algorithm=AWS4-HMAC-SHA256"
+            f"&X-Amz-Credential={quote(f'{self.access_key}/{scope}', safe='-_.~')}"
+            f"&X-Amz-Date={amz_date}"
+            f"&X-Amz-Expires={expires}"
+            f"&X-Amz-SignedHeaders=host"
+        )
+        canonical_suffix = f"\n{query}\nhost:{self._host}\n\nhost\nUNSIGNED-PAYLOAD"
+        string_to_sign_prefix = f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
+        return method, query, canonical_suffix, string_to_sign_prefix, self._get_signing_key(date_stamp)
+    
+    def _sign_key(self, key: str, method: str, query: str, canonical_suffix: str,
+                  string_to_sign_prefix: str, signing_key: bytes) -> str:
+        """Sign one object key using the precomputed values from _signing_params."""
+        path = '/' + quote(key, safe='/~')
+        canonical_request = f"{method}\n{path}{canonical_suffix}"
+        string_to_sign = string_to_sign_prefix + hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
+        signature = hmac.new(signing_key, string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+        
+        return f"https://{self._host}{path}?{query}&X-Amz-Signature={signature}"
     
     def test_connection(self) -> bool:
         """
@@ -1,82 +1,245 @@
 """
-Storage system for meetings using JSON files.
+Storage system for meetings using SQLite.
 """
-import json
+import asyncio
+import sqlite3
+import threading
+import orjson
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, List
-from .models import Meeting
+from .models import Meeting, Update
+
+
+# PRAGMA user_version once the legacy JSON meetings have been imported
+JSON_IMPORTED_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id TEXT PRIMARY KEY,
+    created_by TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    name TEXT,
+    link TEXT,
+    is_closed INTEGER NOT NULL DEFAULT 0,
+    closed_at TEXT
+);
+CREATE TABLE IF NOT EXISTS updates (
+    id INTEGER PRIMARY KEY,
+    meeting_id TEXT NOT NULL REFERENCES meetings(id),
+    user TEXT NOT NULL,
+    progress TEXT NOT NULL,
+    blockers TEXT NOT NULL,
+    goals TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    UNIQUE (meeting_id, user)
+);
+"""
 
 
 class MeetingStorage:
-    """Handles storage and retrieval of meetings using JSON files."""
-    
+    """Handles storage and retrieval of meetings using a SQLite database."""
+
     def __init__(self, storage_dir: str = "json"):
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
-    
-    def _get_meeting_path(self, meeting_id: str) -> Path:
-        """Get the file path for a meeting."""
-        meeting_dir = self.storage_dir / meeting_id
-        meeting_dir.mkdir(exist_ok=True)
-        return meeting_dir / "meeting.json"
-    
+
+        db_path = self.storage_dir / "meetings.db"
+
+        # Autocommit mode; multi-statement writes open their own transaction.
+        # The *_async methods run in worker threads, so the connection is shared
+        # across threads and every access is serialized by self._lock.
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.RLock()
+
+        # Write-through LRU cache of loaded meetings. Callers get the cached
+        # instance itself; meetings are only mutated on the event loop.
+        self._cache: OrderedDict[str, Meeting] = OrderedDict()
+        self._max_cached = 256
+
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < JSON_IMPORTED_VERSION:
+            self._import_json_meetings()
+
+    def _cache_meeting(self, meeting: Meeting) -> None:
+        """Insert or refresh a meeting in the cache, evicting the least recently used."""
+        self._cache[meeting.id] = meeting
+        self._cache.move_to_end(meeting.id)
+        if len(self._cache) > self._max_cached:
+            self._cache.popitem(last=False)
+
+    def _import_json_meetings(self) -> None:
+        """
+        Import meetings saved by the previous JSON file storage (json/<meeting_id>/meeting.json).
+
+        The import runs in a single transaction that also records its completion
+        in PRAGMA user_version, so an interrupted import is retried on the next
+        start. Meetings already in the database are left untouched.
+        """
+        try:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                for meeting_path in self.storage_dir.glob("*/meeting.json"):
+                    try:
+                        with open(meeting_path, 'rb') as f:
+                            meeting = Meeting.from_dict(orjson.loads(f.read()))
+                    except (OSError, orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                        print(f"Error importing meeting from {meeting_path}: {e}")
+                        continue
+
+                    self._conn.execute(
+                        """
+                        INSERT OR IGNORE INTO meetings (id, created_by, created_at, name, link, is_closed, closed_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (meeting.id, meeting.created_by, meeting.created_at, meeting.name,
+                         meeting.link, int(meeting.is_closed), meeting.closed_at)
+                    )
+                    self._insert_updates(meeting)
+                self._conn.execute(f"PRAGMA user_version = {JSON_IMPORTED_VERSION}")
+        except sqlite3.Error as e:
+            print(f"Error importing JSON meetings, will retry on next start: {e}")
+
     def save_meeting(self, meeting: Meeting) -> None:
-        """Save a meeting to storage."""
-        meeting_path = self._get_meeting_path(meeting.id)
-        
-        with open(meeting_path, 'w', encoding='utf-8') as f:
-            json.dump(meeting.to_dict(), f, indent=2, ensure_ascii=False)
-    
+        """Save a meeting and any updates not yet stored."""
+        with self._lock:
+            try:
+                self._write_meeting(meeting)
+            except sqlite3.Error:
+                # The caller may have mutated the cached instance; don't serve it
+                self._cache.pop(meeting.id, None)
+                raise
+            self._cache_meeting(meeting)
+
+    def _write_meeting(self, meeting: Meeting) -> None:
+        """Upsert a meeting row and insert its updates in one transaction."""
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                """
+                INSERT INTO meetings (id, created_by, created_at, name, link, is_closed, closed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    link = excluded.link,
+                    is_closed = excluded.is_closed,
+                    closed_at = excluded.closed_at
+                """,
+                (meeting.id, meeting.created_by, meeting.created_at, meeting.name,
+                 meeting.link, int(meeting.is_closed), meeting.closed_at)
+            )
+            self._insert_updates(meeting)
+
+    def _insert_updates(self, meeting: Meeting) -> None:
+        """Insert a meeting's updates in order, skipping users who already have one stored."""
+        self._conn.executemany(
+            """
+            INSERT OR IGNORE INTO updates (meeting_id, user, progress, blockers, goals, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [(meeting.id, u.user, u.progress, u.blockers, u.goals, u.timestamp) for u in meeting.updates]
+        )
+
+    def add_update(self, meeting_id: str, update: Update) -> None:
+        """Append a single update to a stored meeting."""
+        with self._lock:
+            try:
+                self._conn.execute(
+                    """
+                    INSERT INTO updates (meeting_id, user, progress, blockers, goals, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (meeting_id, update.user, update.progress, update.blockers, update.goals, update.timestamp)
+                )
+            except sqlite3.IntegrityError as e:
+                self._cache.pop(meeting_id, None)
+                raise ValueError("You have already submitted an update for this meeting") from e
+            except sqlite3.Error:
+                self._cache.pop(meeting_id, None)
+                raise
+
+            # The cached meeting is only current if the update was added to that instance
+            cached = self._cache.get(meeting_id)
+            if cached is not None and (not cached.updates or cached.updates[-1] is not update):
+                del self._cache[meeting_id]
+
     def load_meeting(self, meeting_id: str) -> Optional[Meeting]:
         """Load a meeting from storage."""
-        meeting_path = self._get_meeting_path(meeting_id)
-        
-        if not meeting_path.exists():
-            return None
-        
-        try:
-            with open(meeting_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return Meeting.from_dict(data)
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            print(f"Error loading meeting {meeting_id}: {e}")
-            return None
-    
+        with self._lock:
+            cached = self._cache.get(meeting_id)
+            if cached is not None:
+                self._cache.move_to_end(meeting_id)
+                return cached
+
+            try:
+                row = self._conn.execute(
+                    "SELECT id, created_by, created_at, name, link, is_closed, closed_at FROM meetings WHERE id = ?",
+                    (meeting_id,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                update_rows = self._conn.execute(
+                    "SELECT user, progress, blockers, goals, timestamp FROM updates WHERE meeting_id = ? ORDER BY id",
+                    (meeting_id,)
+                ).fetchall()
+
+                meeting = Meeting(
+                    id=row[0],
+                    created_by=row[1],
+                    created_at=row[2],
+                    updates=[Update.from_stored(*u) for u in update_rows],
+                    name=row[3],
+                    link=row[4],
+                    is_closed=bool(row[5]),
+                    closed_at=row[6]
+                )
+                self._cache_meeting(meeting)
+                return meeting
+            except (sqlite3.Error, ValueError) as e:
+                print(f"Error loading meeting {meeting_id}: {e}")
+                return None
+
+    async def save_meeting_async(self, meeting: Meeting) -> None:
+        """Save a meeting from a worker thread without blocking the event loop."""
+        await asyncio.to_thread(self.save_meeting, meeting)
+
+    async def add_update_async(self, meeting_id: str, update: Update) -> None:
+        """Append a single update from a worker thread without blocking the event loop."""
+        await asyncio.to_thread(self.add_update, meeting_id, update)
+
+    async def load_meeting_async(self, meeting_id: str) -> Optional[Meeting]:
+        """Load a meeting from a worker thread without blocking the event loop."""
+        return await asyncio.to_thread(self.load_meeting, meeting_id)
+
     def meeting_exists(self, meeting_id: str) -> bool:
         """Check if a meeting exists."""
-        meeting_path = self._get_meeting_path(meeting_id)
-        return meeting_path.exists()
-    
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
+            return row is not None
+
     def list_meetings(self) -> List[str]:
         """List all meeting IDs."""
-        if not self.storage_dir.exists():
-            return []
-        
-        meeting_ids = []
-        for meeting_dir in self.storage_dir.iterdir():
-            if meeting_dir.is_dir() and (meeting_dir / "meeting.json").exists():
-                meeting_ids.append(meeting_dir.name)
-        
-        return meeting_ids
-    
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT id FROM meetings")]
+
     def delete_meeting(self, meeting_id: str) -> bool:
-        """Delete a meeting and its directory."""
-        meeting_path = self._get_meeting_path(meeting_id)
-        
-        if not meeting_path.exists():
-            return False
-        
-        try:
-            # Delete the meeting file
-            meeting_path.unlink()
-            
-            # Delete the meeting directory if it's empty
-            meeting_dir = meeting_path.parent
-            if meeting_dir.exists() and not any(meeting_dir.iterdir()):
-                meeting_dir.rmdir()
-            
-            return True
-        except OSError as e:
-            print(f"Error deleting meeting {meeting_id}: {e}")
-            return False
+        """Delete a meeting and its updates."""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute("BEGIN")
+                    self._conn.execute("DELETE FROM updates WHERE meeting_id = ?", (meeting_id,))
+                    cursor = self._conn.execute("DELETE FROM meetings WHERE id = ?", (meeting_id,))
+                self._cache.pop(meeting_id, None)
+                return cursor.rowcount > 0
+            except sqlite3.Error as e:
+                print(f"Error deleting meeting {meeting_id}: {e}")
+                return False
 
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()